@@ -27,21 +27,27 @@ from django.urls import path, include
 from django.conf.urls.static import static
 from django.conf import settings
 
-urlpatterns = [
-    # Admin site URL
-    path("admin/", admin.site.urls),
+api_urlpatterns = [
     # API schema endpoint for generating the OpenAPI schema
-    path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
+    path("schema/", SpectacularAPIView.as_view(), name="api-schema"),
     # Swagger UI for API documentation
     path(
-        "api/docs/",
+        "docs/",
         SpectacularSwaggerView.as_view(url_name="api-schema"),
         name="api-docs",
     ),
     # User-related API endpoints
-    path("api/user/", include("user.urls")),
+    path("user/", include("user.urls")),
     # Recipe-related API endpoints
-    path("api/recipe/", include("recipe.urls")),
+    path("recipe/", include("recipe.urls")),
+]
+
+urlpatterns = [
+    # Admin site URL
+    path("admin/", admin.site.urls),
+    # All API endpoints share one prefix so non-API requests
+    # are resolved without scanning them
+    path("api/", include(api_urlpatterns)),
 ]
 
 # Serve media files during development
@@ -21,6 +21,11 @@ from django.db.utils import OperationalError
 from django.core.management.base import BaseCommand
 
 
+# Initial delay between connection attempts and its upper bound, in seconds
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+
+
 class Command(BaseCommand):
     """Django management command to wait for the database to be available."""
 
@@ -28,6 +33,7 @@ class Command(BaseCommand):
         """Handle the command execution."""
         self.stdout.write("Waiting for database...")
         db_up = False
+        delay = INITIAL_DELAY
 
         while not db_up:
             try:
@@ -35,8 +41,11 @@ class Command(BaseCommand):
                 self.check(databases=["default"])
                 db_up = True
             except (Psycopg2OpError, OperationalError):
-                # Log the unavailability and wait before retrying
-                self.stdout.write("Database unavailable, waiting 1 second...")
-                time.sleep(1)
+                # Log the unavailability and back off before retrying
+                self.stdout.write(
+                    f"Database unavailable, waiting {delay:g} seconds..."
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_DELAY)
 
         self.stdout.write(self.style.SUCCESS("Database available!"))
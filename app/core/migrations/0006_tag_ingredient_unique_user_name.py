@@ -0,0 +1,55 @@
+# Generated by Django 3.2.25 on 2026-10-15 21:47
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_names(apps, schema_editor):
+    """Merge tags and ingredients sharing a name into the oldest one."""
+    Recipe = apps.get_model('core', 'Recipe')
+    for model_name, field_name in (('tag', 'tags'), ('ingredient', 'ingredients')):
+        model = apps.get_model('core', model_name)
+        through = getattr(Recipe, field_name).through
+        column = f'{model_name}_id'
+        duplicates = (
+            model.objects.values('user', 'name')
+            .annotate(count=Count('id'), keep=Min('id'))
+            .filter(count__gt=1)
+        )
+        for duplicate in duplicates:
+            keep = duplicate['keep']
+            extra = model.objects.filter(
+                user=duplicate['user'], name=duplicate['name'],
+            ).exclude(id=keep)
+            linked = set(through.objects.filter(
+                **{column: keep}).values_list('recipe_id', flat=True))
+            moved = set(through.objects.filter(
+                **{f'{column}__in': extra}).values_list('recipe_id', flat=True))
+            through.objects.bulk_create([
+                through(recipe_id=recipe_id, **{column: keep})
+                for recipe_id in moved - linked
+            ])
+            extra.delete()
+
+    # Fire deferred foreign key checks now, as Postgres refuses to alter
+    # a table with pending trigger events
+    schema_editor.connection.check_constraints()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_recipe_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_names, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='ingredient',
+            constraint=models.UniqueConstraint(fields=('user', 'name'), name='uniq_ingredient_user_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='tag',
+            constraint=models.UniqueConstraint(fields=('user', 'name'), name='uniq_tag_user_name'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 3.2.25 on 2026-10-15 21:49
+
+from django.db import migrations, models
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db.models.functions import Length
+
+
+def check_titles_and_links(apps, schema_editor):
+    """
+    Refuse to migrate while recipes would not fit the new fields.
+
+    Rows are reported rather than edited, so no user data is lost.
+    """
+    Recipe = apps.get_model('core', 'Recipe')
+    problems = {
+        'title longer than 128 characters': list(
+            Recipe.objects.annotate(title_length=Length('title'))
+            .filter(title_length__gt=128).values_list('id', flat=True)
+        ),
+        'link longer than 200 characters': list(
+            Recipe.objects.annotate(link_length=Length('link'))
+            .filter(link_length__gt=200).values_list('id', flat=True)
+        ),
+        'link that is not a valid URL': [],
+    }
+    validate_url = URLValidator()
+    links = Recipe.objects.exclude(link='').values_list('id', 'link')
+    for recipe_id, link in links.iterator():
+        try:
+            validate_url(link)
+        except ValidationError:
+            problems['link that is not a valid URL'].append(recipe_id)
+
+    report = [
+        f'{problem}: {", ".join(map(str, sorted(ids)))}'
+        for problem, ids in problems.items() if ids
+    ]
+    if report:
+        raise ValueError(
+            'Fix these recipes before migrating, by id:\n'
+            + '\n'.join(report)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_tag_ingredient_unique_user_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_titles_and_links, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='recipe',
+            name='link',
+            field=models.URLField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='recipe',
+            name='title',
+            field=models.CharField(max_length=128),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 3.2.25 on 2026-10-15 21:55
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast, Round
+
+
+def price_to_cents(apps, schema_editor):
+    Recipe = apps.get_model('core', 'Recipe')
+    Recipe.objects.update(
+        price_cents=Cast(
+            Round(F('price') * 100),
+            models.PositiveIntegerField(),
+        ),
+    )
+
+
+def cents_to_price(apps, schema_editor):
+    Recipe = apps.get_model('core', 'Recipe')
+    recipes = list(Recipe.objects.only('price_cents'))
+    for recipe in recipes:
+        recipe.price = Decimal(recipe.price_cents) / 100
+    Recipe.objects.bulk_update(recipes, ['price'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_recipe_user_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='price_cents',
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='recipe',
+            name='price',
+            field=models.DecimalField(decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.RunPython(price_to_cents, cents_to_price),
+        migrations.RemoveField(
+            model_name='recipe',
+            name='price',
+        ),
+    ]
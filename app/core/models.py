@@ -8,6 +8,7 @@ It also includes custom file path generation for recipe images.
 Dependencies:
 - uuid
 - os
+- decimal.Decimal
 - django.conf.settings
 - django.db.models
 - django.contrib.auth.models.AbstractBaseUser,
@@ -17,6 +18,7 @@ Dependencies:
 
 import uuid
 import os
+from decimal import Decimal
 
 from django.conf import settings
 from django.db import models
@@ -40,9 +42,9 @@ def recipe_image_file_path(instance, filename):
         str: The file path for the new recipe image.
     """
     ext = os.path.splitext(filename)[1]
-    filename = f"{uuid.uuid4()}{ext}"
 
-    return os.path.join("uploads", "recipe", filename)
+    # Storage keys are always POSIX-style, so no os.path.join is needed
+    return f"uploads/recipe/{uuid.uuid4().hex}{ext}"
 
 
 class UserManager(BaseUserManager):
@@ -83,12 +85,12 @@ class UserManager(BaseUserManager):
         Returns:
             User: The created superuser instance.
         """
-        user = self.create_user(email, password)
-        user.is_staff = True
-        user.is_superuser = True
-        user.save(using=self._db)
-
-        return user
+        return self.create_user(
+            email,
+            password,
+            is_staff=True,
+            is_superuser=True,
+        )
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -120,22 +122,40 @@ class Recipe(models.Model):
     price, and associated tags and ingredients.
     """
 
+    # Indexed through the (user, id) index declared in Meta
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
+        db_index=False,
     )
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=128)
     description = models.TextField(blank=True)
     time_minutes = models.IntegerField()
-    price = models.DecimalField(max_digits=5, decimal_places=2)
-    link = models.CharField(max_length=255, blank=True)
+    price_cents = models.PositiveIntegerField()
+    link = models.URLField(max_length=200, blank=True)
     tags = models.ManyToManyField("Tag")
     ingredients = models.ManyToManyField("Ingredient")
     image = models.ImageField(null=True, upload_to=recipe_image_file_path)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "id"], name="recipe_user_id_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
+    @property
+    def price(self):
+        """Price as a Decimal, derived from the stored integer cents."""
+        return Decimal(self.price_cents).scaleb(-2)
+
+    @price.setter
+    def price(self, value):
+        self.price_cents = int(
+            Decimal(value).quantize(Decimal("0.01")).scaleb(2)
+        )
+
 
 class Tag(models.Model):
     """
@@ -150,6 +170,14 @@ class Tag(models.Model):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "name"],
+                name="uniq_tag_user_name",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -168,5 +196,13 @@ class Ingredient(models.Model):
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "name"],
+                name="uniq_ingredient_user_name",
+            ),
+        ]
+
     def __str__(self):
         return self.name
@@ -4,20 +4,27 @@ Tests for modifications in the Django admin site.
 This module contains test cases for verifying customizations
 and functionalities added to the Django admin site.
 It includes tests for listing, editing,
-and creating users in the admin interface.
+and creating users in the admin interface,
+as well as listing recipes.
 
 Dependencies:
+- decimal.Decimal
 - django.test.TestCase
 - django.contrib.auth.get_user_model
 - django.urls.reverse
 - django.test.Client
+- core.models.Recipe
 """
 
+from decimal import Decimal
+
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.test import Client
 
+from core.models import Recipe
+
 
 class AdminSiteTests(TestCase):
     """Tests for Django admin site modifications."""
@@ -59,3 +66,38 @@ class AdminSiteTests(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
+
+    def test_recipes_list(self):
+        """Test that the recipes changelist shows the owning user."""
+        recipe = Recipe.objects.create(
+            user=self.user,
+            title="Sample recipe",
+            time_minutes=5,
+            price=Decimal("4.50"),
+        )
+        url = reverse("admin:core_recipe_changelist")
+        response = self.client.get(url)
+
+        self.assertContains(response, recipe.title)
+        self.assertContains(response, self.user.email)
+
+    def test_export_recipes_as_csv(self):
+        """Test that selected recipes can be exported as CSV."""
+        recipe = Recipe.objects.create(
+            user=self.user,
+            title="Sample recipe",
+            time_minutes=5,
+            price=Decimal("4.50"),
+        )
+        url = reverse("admin:core_recipe_changelist")
+        response = self.client.post(url, {
+            "action": "export_as_csv",
+            "_selected_action": [recipe.id],
+        })
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn(
+            f"{recipe.id},Sample recipe,{self.user.email},5,4.50,",
+            content,
+        )
@@ -51,3 +51,7 @@ class CommandTests(SimpleTestCase):
         # was called the expected number of times
         self.assertEqual(patched_check.call_count, 6)
         patched_check.assert_called_with(databases=["default"])
+
+        # Verify the delay doubles between attempts up to the cap
+        delays = [c.args[0] for c in patched_sleep.call_args_list]
+        self.assertEqual(delays, [0.1, 0.2, 0.4, 0.8, 1.6])
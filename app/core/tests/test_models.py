@@ -9,6 +9,7 @@ and the creation of recipe, tag, and ingredient models.
 Dependencies:
 - unittest.mock.patch
 - decimal.Decimal
+- django.db.IntegrityError
 - django.test.TestCase
 - django.contrib.auth.get_user_model
 - core.models
@@ -16,6 +17,7 @@ Dependencies:
 
 from unittest.mock import patch
 from decimal import Decimal
+from django.db import IntegrityError
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from core import models
@@ -103,6 +105,16 @@ class ModelTests(TestCase):
 
         self.assertEqual(str(tag), tag.name)
 
+    def test_tag_name_unique_per_user(self):
+        """
+        Test that a user cannot have two tags with the same name.
+        """
+        user = create_user()
+        models.Tag.objects.create(user=user, name="Tag1")
+
+        with self.assertRaises(IntegrityError):
+            models.Tag.objects.create(user=user, name="Tag1")
+
     def test_create_ingredient(self):
         """
         Test that creating an ingredient is successful.
@@ -120,8 +132,8 @@ class ModelTests(TestCase):
         """
         Test that the recipe image file path is generated using a UUID.
         """
-        uuid = "test-uuid"
-        mock_uuid.return_value = uuid
+        uuid = "testuuid"
+        mock_uuid.return_value.hex = uuid
         file_path = models.recipe_image_file_path(None, "example.jpg")
 
         self.assertEqual(file_path, f"uploads/recipe/{uuid}.jpg")
@@ -6,12 +6,51 @@ It includes serializers for creating, updating, and viewing recipe details,
 as well as handling image uploads.
 """
 
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from core.models import Recipe, Tag, Ingredient
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class UniqueNameMixin:
+    """
+    Validate a recipe attribute name is unique for the user.
+
+    Only applies when the serializer is used on its own. Nested under a
+    recipe, existing names are looked up and reused instead.
+    """
+
+    def validate_name(self, value):
+        """
+        Ensure the user has no other item with this name.
+
+        Args:
+            value (str): The submitted name.
+
+        Returns:
+            str: The validated name.
+
+        Raises:
+            serializers.ValidationError: If the name is already taken.
+        """
+        request = self.context.get("request")
+        if self.parent is not None or request is None:
+            return value
+
+        model = self.Meta.model
+        queryset = model.objects.filter(user=request.user, name=value)
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError(
+                f"A {model._meta.verbose_name} with this name already exists."
+            )
+
+        return value
+
+
+class IngredientSerializer(UniqueNameMixin, serializers.ModelSerializer):
     """
     Serializer for ingredients.
 
@@ -25,7 +64,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(UniqueNameMixin, serializers.ModelSerializer):
     """
     Serializer for tags.
 
@@ -39,6 +78,29 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
+class PriceField(serializers.DecimalField):
+    """
+    Decimal price field backed by an integer number of cents.
+
+    Prices are accepted and rendered as decimal strings (e.g. "5.99")
+    but stored as cents, so rendering needs no Decimal arithmetic.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("max_digits", 5)
+        kwargs.setdefault("decimal_places", 2)
+        kwargs.setdefault("min_value", 0)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        """Validate the decimal price and convert it to cents."""
+        return int(super().to_internal_value(data).scaleb(2))
+
+    def to_representation(self, value):
+        """Format cents as a decimal string with two places."""
+        return f"{value // 100}.{value % 100:02d}"
+
+
 class RecipeSerializer(serializers.ModelSerializer):
     """
     Serializer for recipes.
@@ -49,6 +111,17 @@ class RecipeSerializer(serializers.ModelSerializer):
 
     tags = TagSerializer(many=True, required=False)
     ingredients = IngredientSerializer(many=True, required=False)
+    price = PriceField(source="price_cents")
+    tag_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        write_only=True,
+        required=False,
+    )
+    ingredient_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        write_only=True,
+        required=False,
+    )
 
     class Meta:
         model = Recipe
@@ -59,27 +132,170 @@ class RecipeSerializer(serializers.ModelSerializer):
             "price",
             "link",
             "tags",
-            "ingredients"
+            "ingredients",
+            "tag_ids",
+            "ingredient_ids",
             ]
         read_only_fields = ["id"]
 
-    def _get_or_create_tags(self, tags, recipe):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Prefetch the related objects rendered by this serializer.
+
+        Without this, every recipe in a list triggers two extra queries
+        to load its tags and ingredients.
+
+        Args:
+            queryset (QuerySet): Recipe queryset to optimise.
+
+        Returns:
+            QuerySet: The queryset with tags and ingredients prefetched.
+        """
+        return queryset.prefetch_related(
+            Prefetch("tags", queryset=Tag.objects.only("id", "name")),
+            Prefetch(
+                "ingredients",
+                queryset=Ingredient.objects.only("id", "name"),
+            ),
+        )
+
+    @cached_property
+    def _auth_user(self):
+        """Return the authenticated user, resolved once per serializer."""
+        return self.context["request"].user
+
+    def _get_or_create_objects(self, model, items):
+        """
+        Fetch or create the user's objects for the given items in bulk.
+
+        Args:
+            model (Model): Tag or Ingredient model class.
+            items (list): List of validated data dicts with a "name" key.
+
+        Returns:
+            list: The matching model instances for the authenticated user.
+        """
+        auth_user = self._auth_user
+        # Drop repeated names up front, keeping the submitted order
+        names = list(dict.fromkeys(item["name"] for item in items))
+        if not names:
+            return []
+
+        existing = model.objects.filter(user=auth_user, name__in=names)
+        found = {obj.name for obj in existing}
+        missing = [
+            model(user=auth_user, name=name)
+            for name in names
+            if name not in found
+        ]
+        if missing:
+            model.objects.bulk_create(missing, ignore_conflicts=True)
+            existing = existing.all()
+
+        return list(existing)
+
+    def _validate_owned_ids(self, model, ids):
+        """
+        Check that all ids belong to the authenticated user's objects.
+
+        Args:
+            model (Model): Tag or Ingredient model class.
+            ids (list): List of primary keys submitted by the client.
+
+        Returns:
+            list: The ids with duplicates removed.
+
+        Raises:
+            serializers.ValidationError: If any id is unknown to the user.
+        """
+        auth_user = self._auth_user
+        ids = list(dict.fromkeys(ids))
+        found = set(
+            model.objects.filter(user=auth_user, id__in=ids)
+            .values_list("id", flat=True)
+        )
+        invalid = [pk for pk in ids if pk not in found]
+        if invalid:
+            raise serializers.ValidationError(
+                f"Invalid pk(s) {invalid} - object does not exist."
+            )
+
+        return ids
+
+    def validate_tag_ids(self, value):
+        """Validate that the tag ids belong to the authenticated user."""
+        return self._validate_owned_ids(Tag, value)
+
+    def validate_ingredient_ids(self, value):
+        """Validate that the ingredient ids belong to the current user."""
+        return self._validate_owned_ids(Ingredient, value)
+
+    def _add_relations(self, through_model, field, recipe, ids):
+        """
+        Link the recipe to the given ids with a single INSERT.
+
+        Args:
+            through_model (Model): M2M through model of the relation.
+            field (str): Name of the through model's foreign key column.
+            recipe (Recipe): Recipe instance to link from.
+            ids (list): Primary keys of the objects to link.
+        """
+        through_model.objects.bulk_create(
+            [
+                through_model(recipe_id=recipe.id, **{field: pk})
+                for pk in dict.fromkeys(ids)
+            ],
+            ignore_conflicts=True,
+        )
+
+    def _set_relations(self, through_model, field, recipe, ids):
+        """
+        Make the recipe's links match the given ids.
+
+        Only links that were removed or added are written, so an
+        unchanged set costs no writes at all.
+
+        Args:
+            through_model (Model): M2M through model of the relation.
+            field (str): Name of the through model's foreign key column.
+            recipe (Recipe): Recipe instance to link from.
+            ids (list): Primary keys of the objects to keep linked.
+        """
+        links = through_model.objects.filter(recipe_id=recipe.id)
+        current_ids = set(links.values_list(field, flat=True))
+        new_ids = set(ids)
+        stale_ids = current_ids - new_ids
+        if stale_ids:
+            links.filter(**{f"{field}__in": stale_ids}).delete()
+        self._add_relations(
+            through_model,
+            field,
+            recipe,
+            new_ids - current_ids,
+        )
+
+    def _get_or_create_tags(self, tags, recipe, tag_ids=(), replace=False):
         """
         Handle getting or creating tags as needed.
 
         Args:
             tags (list): List of tags data to be processed.
             recipe (Recipe): Recipe instance to which tags are to be added.
+            tag_ids (list, optional): Ids of existing tags to add as well.
+            replace (bool, optional): Unlink tags that are not listed.
         """
-        auth_user = self.context["request"].user
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag,
-            )
-            recipe.tags.add(tag_obj)
-
-    def _get_or_create_ingredients(self, ingredients, recipe):
+        tag_objs = self._get_or_create_objects(Tag, tags)
+        link = self._set_relations if replace else self._add_relations
+        link(
+            Recipe.tags.through,
+            "tag_id",
+            recipe,
+            [tag.id for tag in tag_objs] + list(tag_ids),
+        )
+
+    def _get_or_create_ingredients(self, ingredients, recipe,
+                                   ingredient_ids=(), replace=False):
         """
         Handle getting or creating ingredients as needed.
 
@@ -87,14 +303,19 @@ class RecipeSerializer(serializers.ModelSerializer):
             ingredients (list): List of ingredients data to be processed.
             recipe (Recipe): Recipe instance
             to which ingredients are to be added.
+            ingredient_ids (list, optional): Ids of existing ingredients
+            to add as well.
+            replace (bool, optional): Unlink ingredients that are not listed.
         """
-        auth_user = self.context["request"].user
-        for ingredient in ingredients:
-            ingredient_obj, created = Ingredient.objects.get_or_create(
-                user=auth_user,
-                **ingredient,
-            )
-            recipe.ingredients.add(ingredient_obj)
+        ingredient_objs = self._get_or_create_objects(Ingredient, ingredients)
+        link = self._set_relations if replace else self._add_relations
+        link(
+            Recipe.ingredients.through,
+            "ingredient_id",
+            recipe,
+            [ingredient.id for ingredient in ingredient_objs]
+            + list(ingredient_ids),
+        )
 
     def create(self, validated_data):
         """
@@ -108,9 +329,11 @@ class RecipeSerializer(serializers.ModelSerializer):
         """
         tags = validated_data.pop("tags", [])
         ingredients = validated_data.pop("ingredients", [])
+        tag_ids = validated_data.pop("tag_ids", [])
+        ingredient_ids = validated_data.pop("ingredient_ids", [])
         recipe = Recipe.objects.create(**validated_data)
-        self._get_or_create_tags(tags, recipe)
-        self._get_or_create_ingredients(ingredients, recipe)
+        self._get_or_create_tags(tags, recipe, tag_ids)
+        self._get_or_create_ingredients(ingredients, recipe, ingredient_ids)
 
         return recipe
 
@@ -127,12 +350,22 @@ class RecipeSerializer(serializers.ModelSerializer):
         """
         tags = validated_data.pop("tags", None)
         ingredients = validated_data.pop("ingredients", None)
-        if tags is not None:
-            instance.tags.clear()
-            self._get_or_create_tags(tags, instance)
-        if ingredients is not None:
-            instance.ingredients.clear()
-            self._get_or_create_ingredients(ingredients, instance)
+        tag_ids = validated_data.pop("tag_ids", None)
+        ingredient_ids = validated_data.pop("ingredient_ids", None)
+        if tags is not None or tag_ids is not None:
+            self._get_or_create_tags(
+                tags or [],
+                instance,
+                tag_ids or [],
+                replace=True,
+            )
+        if ingredients is not None or ingredient_ids is not None:
+            self._get_or_create_ingredients(
+                ingredients or [],
+                instance,
+                ingredient_ids or [],
+                replace=True,
+            )
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
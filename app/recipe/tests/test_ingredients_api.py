@@ -90,8 +90,10 @@ class PrivateIngredientsApiTests(TestCase):
         """
         Test retrieving a list of ingredients for an authenticated user.
         """
-        Ingredient.objects.create(user=self.user, name="Kale")
-        Ingredient.objects.create(user=self.user, name="Vanilla")
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name=name)
+            for name in ["Kale", "Vanilla"]
+        ])
 
         res = self.client.get(INGREDIENTS_URL)
 
@@ -129,6 +131,20 @@ class PrivateIngredientsApiTests(TestCase):
         ingredient.refresh_from_db()
         self.assertEqual(ingredient.name, payload["name"])
 
+    def test_update_ingredient_duplicate_name_error(self):
+        """
+        Test renaming an ingredient to a name the user already has fails.
+        """
+        Ingredient.objects.create(user=self.user, name="Coriander")
+        ingredient = Ingredient.objects.create(user=self.user, name="Cilantro")
+
+        payload = {"name": "Coriander"}
+        res = self.client.patch(detail_url(ingredient.id), payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        ingredient.refresh_from_db()
+        self.assertEqual(ingredient.name, "Cilantro")
+
     def test_delete_ingredient(self):
         """
         Test deleting an ingredient for the authenticated user.
@@ -169,20 +185,21 @@ class PrivateIngredientsApiTests(TestCase):
         """
         ing = Ingredient.objects.create(user=self.user, name="Eggs")
         Ingredient.objects.create(user=self.user, name="Lentils")
-        recipe1 = Recipe.objects.create(
-            title="Eggs Benedict",
-            time_minutes=60,
-            price=Decimal("7.00"),
-            user=self.user,
-        )
-        recipe2 = Recipe.objects.create(
-            title="Herb Eggs",
-            time_minutes=20,
-            price=Decimal("4.00"),
-            user=self.user,
-        )
-        recipe1.ingredients.add(ing)
-        recipe2.ingredients.add(ing)
+        Recipe.objects.bulk_create([
+            Recipe(
+                title="Eggs Benedict",
+                time_minutes=60,
+                price=Decimal("7.00"),
+                user=self.user,
+            ),
+            Recipe(
+                title="Herb Eggs",
+                time_minutes=20,
+                price=Decimal("4.00"),
+                user=self.user,
+            ),
+        ])
+        ing.recipe_set.add(*Recipe.objects.filter(user=self.user))
 
         res = self.client.get(INGREDIENTS_URL, {"assigned_only": 1})
 
@@ -91,7 +91,24 @@ class PrivateRecipeAPITests(TestCase):
         recepies = Recipe.objects.all().order_by("-id")
         serializer = RecipeSerializer(recepies, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data["results"], serializer.data)
+
+    def test_retrieve_recipes_prefetches_relations(self):
+        """Test listing recipes does not query tags per recipe."""
+        for title in ["Curry", "Stew", "Soup"]:
+            recipe = create_recipe(user=self.user, title=title)
+            recipe.tags.add(Tag.objects.create(user=self.user, name=title))
+            recipe.ingredients.add(
+                Ingredient.objects.create(user=self.user, name=title)
+            )
+
+        with self.assertNumQueries(3) as ctx:
+            res = self.client.get(RECIPES_URL)
+
+        self.assertNotIn("description", ctx.captured_queries[0]["sql"])
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 3)
 
     def test_recipe_list_limited_to_user(self):
         """Test list of recipies is limited to authenticated user."""
@@ -104,7 +121,7 @@ class PrivateRecipeAPITests(TestCase):
         recipies = Recipe.objects.filter(user=self.user)
         serializer = RecipeSerializer(recipies, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data["results"], serializer.data)
 
     def test_get_recipe_detail(self):
         """Test get recipe detail."""
@@ -131,6 +148,21 @@ class PrivateRecipeAPITests(TestCase):
             self.assertEqual(getattr(recipe, k), v)
         self.assertEqual(recipe.user, self.user)
 
+    def test_create_recipe_price_stored_as_cents(self):
+        """Test recipe prices are stored as cents and rendered as decimals."""
+        payload = {
+            "title": "Sample recipe",
+            "time_minutes": 30,
+            "price": "12.05",
+        }
+        res = self.client.post(RECIPES_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["price"], "12.05")
+        recipe = Recipe.objects.get(id=res.data["id"])
+        self.assertEqual(recipe.price_cents, 1205)
+        self.assertEqual(recipe.price, Decimal("12.05"))
+
     def test_partial_update(self):
         """Test partial update of a recipe."""
         original_link = "https://example.com/recipe.pdf"
@@ -229,6 +261,21 @@ class PrivateRecipeAPITests(TestCase):
             ).exists()
             self.assertTrue(exists)
 
+    def test_create_recipe_with_duplicate_tags(self):
+        """Test creating a recipe with a repeated tag creates it once."""
+        payload = {
+            "title": "Vegan Brownies",
+            "time_minutes": 40,
+            "price": Decimal("3.00"),
+            "tags": [{"name": "Vegan"}, {"name": "Vegan"}],
+        }
+        res = self.client.post(RECIPES_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipe = Recipe.objects.get(id=res.data["id"])
+        self.assertEqual(recipe.tags.count(), 1)
+        self.assertEqual(Tag.objects.filter(user=self.user).count(), 1)
+
     def test_create_recipe_with_existing_tags(self):
         """Test creating a recipe with existing tag."""
         tag_indian = Tag.objects.create(user=self.user, name="Indian")
@@ -253,6 +300,39 @@ class PrivateRecipeAPITests(TestCase):
             ).exists()
             self.assertTrue(exists)
 
+    def test_create_recipe_with_tag_ids(self):
+        """Test creating a recipe with existing tags referenced by id."""
+        tag1 = Tag.objects.create(user=self.user, name="Breakfast")
+        tag2 = Tag.objects.create(user=self.user, name="Quick")
+        payload = {
+            "title": "Omelette",
+            "time_minutes": 10,
+            "price": Decimal("1.50"),
+            "tag_ids": [tag1.id, tag2.id],
+        }
+        res = self.client.post(RECIPES_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipe = Recipe.objects.get(id=res.data["id"])
+        self.assertEqual(recipe.tags.count(), 2)
+        self.assertIn(tag1, recipe.tags.all())
+        self.assertIn(tag2, recipe.tags.all())
+
+    def test_create_recipe_with_other_users_tag_id_error(self):
+        """Test referencing another user's tag by id returns error."""
+        other_user = create_user(email="other@example.com", password="test123")
+        tag = Tag.objects.create(user=other_user, name="Private")
+        payload = {
+            "title": "Omelette",
+            "time_minutes": 10,
+            "price": Decimal("1.50"),
+            "tag_ids": [tag.id],
+        }
+        res = self.client.post(RECIPES_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Recipe.objects.filter(user=self.user).exists())
+
     def test_create_tag_on_update(self):
         """Test creating tag when updating a recipe."""
         recipe = create_recipe(user=self.user)
@@ -280,6 +360,23 @@ class PrivateRecipeAPITests(TestCase):
         self.assertIn(tag_lunch, recipe.tags.all())
         self.assertNotIn(tag_breakfast, recipe.tags.all())
 
+    def test_update_recipe_unchanged_tags_keeps_links(self):
+        """Test resubmitting the same tags does not rewrite the links."""
+        tag = Tag.objects.create(user=self.user, name="Breakfast")
+        recipe = create_recipe(user=self.user)
+        recipe.tags.add(tag)
+        link_id = Recipe.tags.through.objects.get(recipe=recipe).id
+
+        payload = {"tags": [{"name": "Breakfast"}]}
+        url = detail_url(recipe.id)
+        res = self.client.patch(url, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            Recipe.tags.through.objects.get(recipe=recipe).id,
+            link_id,
+        )
+
     def test_clear_recipe_tags(self):
         """Test clearing a recipes tags."""
         tag = Tag.objects.create(user=self.user, name="Dessert")
@@ -395,9 +492,9 @@ class PrivateRecipeAPITests(TestCase):
         s1 = RecipeSerializer(r1)
         s2 = RecipeSerializer(r2)
         s3 = RecipeSerializer(r3)
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        self.assertIn(s1.data, res.data["results"])
+        self.assertIn(s2.data, res.data["results"])
+        self.assertNotIn(s3.data, res.data["results"])
 
     def test_filter_by_ingredients(self):
         """Test filtering recipes by ingredients."""
@@ -415,9 +512,9 @@ class PrivateRecipeAPITests(TestCase):
         s1 = RecipeSerializer(r1)
         s2 = RecipeSerializer(r2)
         s3 = RecipeSerializer(r3)
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        self.assertIn(s1.data, res.data["results"])
+        self.assertIn(s2.data, res.data["results"])
+        self.assertNotIn(s3.data, res.data["results"])
 
 
 class ImageUploadTests(TestCase):
@@ -89,8 +89,9 @@ class PrivateTagsApiTests(TestCase):
         """
         Test retrieving a list of tags for an authenticated user.
         """
-        Tag.objects.create(user=self.user, name="Vegan")
-        Tag.objects.create(user=self.user, name="Dessert")
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name=name) for name in ["Vegan", "Dessert"]
+        ])
 
         res = self.client.get(TAGS_URL)
 
@@ -128,6 +129,19 @@ class PrivateTagsApiTests(TestCase):
         tag.refresh_from_db()
         self.assertEqual(tag.name, payload["name"])
 
+    def test_update_tag_duplicate_name_error(self):
+        """
+        Test renaming a tag to a name the user already has fails.
+        """
+        Tag.objects.create(user=self.user, name="Dessert")
+        tag = Tag.objects.create(user=self.user, name="After Dinner")
+
+        res = self.client.patch(detail_url(tag.id), {"name": "Dessert"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        tag.refresh_from_db()
+        self.assertEqual(tag.name, "After Dinner")
+
     def test_delete_tag(self):
         """
         Test deleting a tag for the authenticated user.
@@ -168,20 +182,21 @@ class PrivateTagsApiTests(TestCase):
         """
         tag = Tag.objects.create(user=self.user, name="Breakfast")
         Tag.objects.create(user=self.user, name="Dinner")
-        recipe1 = Recipe.objects.create(
-            title="Pancakes",
-            time_minutes=5,
-            price=Decimal("5.00"),
-            user=self.user,
-        )
-        recipe2 = Recipe.objects.create(
-            title="Porridge",
-            time_minutes=3,
-            price=Decimal("2.00"),
-            user=self.user,
-        )
-        recipe1.tags.add(tag)
-        recipe2.tags.add(tag)
+        Recipe.objects.bulk_create([
+            Recipe(
+                title="Pancakes",
+                time_minutes=5,
+                price=Decimal("5.00"),
+                user=self.user,
+            ),
+            Recipe(
+                title="Porridge",
+                time_minutes=3,
+                price=Decimal("2.00"),
+                user=self.user,
+            ),
+        ])
+        tag.recipe_set.add(*Recipe.objects.filter(user=self.user))
 
         res = self.client.get(TAGS_URL, {"assigned_only": 1})
 
@@ -6,6 +6,7 @@ models using Django REST Framework. It includes custom filtering and
 image upload functionalities for recipes.
 """
 
+from django.db.models import Exists, OuterRef
 from drf_spectacular.utils import (
     extend_schema_view,
     extend_schema,
@@ -18,6 +19,7 @@ from rest_framework import (
     status,
 )
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
@@ -30,6 +32,28 @@ from core.models import (
 from recipe import serializers
 
 
+# Names of the fields stored as columns on the recipe table
+RECIPE_COLUMNS = {field.name for field in Recipe._meta.concrete_fields}
+# Columns the list serializer renders; the rest are skipped when listing
+RECIPE_LIST_COLUMNS = tuple(
+    field.source
+    for field in serializers.RecipeSerializer().fields.values()
+    if field.source in RECIPE_COLUMNS
+)
+
+
+class RecipeCursorPagination(CursorPagination):
+    """
+    Cursor pagination for recipe lists.
+
+    Bounds the rows (and prefetched tags and ingredients) loaded per
+    request and pages by id instead of a growing OFFSET.
+    """
+
+    page_size = 50
+    ordering = "-id"
+
+
 @extend_schema_view(
     list=extend_schema(
         parameters=[
@@ -51,6 +75,8 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     serializer_class = serializers.RecipeDetailSerializer
     queryset = Recipe.objects.all()
+    lookup_value_regex = r"\d+"
+    pagination_class = RecipeCursorPagination
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
 
@@ -70,9 +96,16 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
 
-        return queryset.filter(
+        queryset = queryset.filter(
             user=self.request.user).order_by("-id").distinct()
 
+        if self.action in ("upload_image", "destroy"):
+            return queryset
+        if self.action == "list":
+            queryset = queryset.only(*RECIPE_LIST_COLUMNS)
+
+        return serializers.RecipeSerializer.setup_eager_loading(queryset)
+
     def get_serializer_class(self):
         """Return the serializer class based on the action."""
         if self.action == "list":
@@ -119,6 +152,7 @@ class BaseRecipeAttrViewSet(
 ):
     """Base viewset for recipe attributes."""
 
+    lookup_value_regex = r"\d+"
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
 
@@ -131,10 +165,16 @@ class BaseRecipeAttrViewSet(
             )
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+            # A semi-join on the through table avoids the DISTINCT
+            # needed to dedupe rows from joining through recipes
+            model_name = queryset.model._meta.model_name
+            queryset = queryset.filter(Exists(
+                self.recipe_through.objects.filter(
+                    **{f"{model_name}_id": OuterRef("pk")}
+                )
+            ))
 
-        return queryset.filter(
-            user=self.request.user).order_by("-name").distinct()
+        return queryset.filter(user=self.request.user).order_by("-name")
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
@@ -142,6 +182,7 @@ class TagViewSet(BaseRecipeAttrViewSet):
 
     serializer_class = serializers.TagSerializer
     queryset = Tag.objects.all()
+    recipe_through = Recipe.tags.through
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
@@ -149,3 +190,4 @@ class IngredientViewSet(BaseRecipeAttrViewSet):
 
     serializer_class = serializers.IngredientSerializer
     queryset = Ingredient.objects.all()
+    recipe_through = Recipe.ingredients.through
@@ -0,0 +1,57 @@
+"""
+Authentication classes for the user API.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+
+from rest_framework.authentication import TokenAuthentication
+
+TOKEN_CACHE_TIMEOUT = 300
+
+
+def token_cache_key(key):
+    """
+    Return the cache key for an auth token.
+
+    The raw token is hashed so it never appears in the cache backend.
+
+    Args:
+        key (str): The auth token key.
+
+    Returns:
+        str: The cache key for the token.
+    """
+    return "tok:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication that caches successful token lookups."""
+
+    def authenticate_credentials(self, key):
+        """
+        Return the (user, token) pair for the key, using the cache first.
+
+        A cache hit needs no database query. Saving or deleting the token
+        or saving the user drops the entry, while writes that skip signals
+        are only seen once it expires. Views that save the user must
+        reload it rather than save the cached instance.
+
+        Args:
+            key (str): The auth token key sent by the client.
+
+        Returns:
+            tuple: The authenticated user and token.
+
+        Raises:
+            AuthenticationFailed: If the token is invalid
+            or the user is inactive.
+        """
+        cache_key = token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            credentials = super().authenticate_credentials(key)
+            cache.set(cache_key, credentials, timeout=TOKEN_CACHE_TIMEOUT)
+
+        return credentials
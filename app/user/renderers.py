@@ -0,0 +1,43 @@
+"""
+Renderers for the API.
+"""
+
+import orjson
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils import encoders
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render data as JSON using orjson.
+
+    Types orjson does not handle natively, such as Decimal and lazy
+    translation strings, fall back to DRF's JSON encoder.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes.
+
+        Args:
+            data: The data to render.
+            accepted_media_type (str, optional): The negotiated media type.
+            renderer_context (dict, optional): The view and request context.
+
+        Returns:
+            bytes: The JSON encoded data.
+        """
+        if data is None:
+            return b""
+
+        return orjson.dumps(
+            data,
+            default=encoders.JSONEncoder().default,
+            option=self.options,
+        )
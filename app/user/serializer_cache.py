@@ -0,0 +1,32 @@
+"""
+Caching helpers for serializers.
+"""
+
+import copy
+
+
+class SerializerCacheMixin:
+    """
+    Build a serializer class's fields once and copy them per instance.
+
+    ModelSerializer introspects the model every time a serializer is
+    instantiated. The unbound fields are instead built on first use,
+    kept on the class, and deep-copied for each instance, the same way
+    DRF handles declared fields. Only use this on serializers whose
+    fields do not depend on the instance or context.
+    """
+
+    def get_fields(self):
+        """
+        Return fresh copies of the class's cached fields.
+
+        Returns:
+            dict: Mapping of field names to unbound field instances.
+        """
+        cls = type(self)
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+
+        return copy.deepcopy(fields)
@@ -2,18 +2,114 @@
 Serializers for the user API view.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare, salted_hmac
 from django.utils.translation import gettext as _
 
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from user.serializer_cache import SerializerCacheMixin
+
+CREDENTIALS_CACHE_TIMEOUT = 120
+MAX_BULK_USERS = 100
+
+
+class BulkUserListSerializer(serializers.ListSerializer):
+    """Serializer for creating many users with a single INSERT."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("allow_empty", False)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        """
+        Validate every user in the list.
+
+        The list size is checked first, so an oversized list is rejected
+        before any user is validated against the database.
+
+        Args:
+            data (list): The submitted users.
+
+        Returns:
+            list: The validated data of every user.
+
+        Raises:
+            serializers.ValidationError: If the list is too large
+            or any user is invalid.
+        """
+        if isinstance(data, list) and len(data) > MAX_BULK_USERS:
+            msg = _("Ensure this list has no more than {max} users.")
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    msg.format(max=MAX_BULK_USERS),
+                ],
+            }, code="max_length")
+
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        """
+        Validate the batch as a whole.
+
+        Args:
+            attrs (list): The validated data of every user.
+
+        Returns:
+            list: The validated data.
 
+        Raises:
+            serializers.ValidationError: If the batch repeats
+            an email address.
+        """
+        normalize_email = get_user_model().objects.normalize_email
+        emails = [normalize_email(item["email"]) for item in attrs]
+        if len(set(emails)) != len(emails):
+            msg = _("Each user in the list must have a unique email.")
+            raise serializers.ValidationError(msg)
+
+        return attrs
 
-class UserSerializer(serializers.ModelSerializer):
+    def create(self, validated_data):
+        """
+        Create and return users, hashing their passwords in parallel.
+
+        Args:
+            validated_data (list): The validated data of every user.
+
+        Returns:
+            list: The created user instances.
+        """
+        user_model = get_user_model()
+        passwords = [item.pop("password") for item in validated_data]
+        # PBKDF2 releases the GIL, so threads hash on all cores
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            hashes = list(executor.map(make_password, passwords))
+
+        users = [
+            user_model(
+                email=user_model.objects.normalize_email(item.pop("email")),
+                password=password_hash,
+                **item,
+            )
+            for item, password_hash in zip(validated_data, hashes)
+        ]
+        return user_model.objects.bulk_create(users, batch_size=500)
+
+
+class UserSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """Serializer for the user object."""
 
     class Meta:
         model = get_user_model()
         fields = ["email", "password", "name"]
+        list_serializer_class = BulkUserListSerializer
         extra_kwargs = {
             "password": {
                 "write_only": True,
@@ -34,6 +130,21 @@ class UserSerializer(serializers.ModelSerializer):
         """
         return get_user_model().objects.create_user(**validated_data)
 
+    def to_representation(self, instance):
+        """
+        Return the public fields of the user.
+
+        Built directly rather than through the generic per-field loop,
+        as this runs on every profile request.
+
+        Args:
+            instance (User): The user instance to represent.
+
+        Returns:
+            dict: The user's email and name.
+        """
+        return {"email": instance.email, "name": instance.name}
+
     def update(self, instance, validated_data):
         """
         Update and return the user instance.
@@ -63,10 +174,58 @@ class AuthTokenSerializer(serializers.Serializer):
         style={"input_type": "password"}, trim_whitespace=False
     )
 
+    def _credentials_cache_key(self, email, password):
+        """Return a keyed hash identifying the submitted credentials."""
+        digest = salted_hmac(
+            "user.AuthTokenSerializer",
+            f"{email}:{password}",
+            algorithm="sha256",
+        ).hexdigest()
+        return f"pwok:{digest}"
+
+    def _password_digest(self, user):
+        """Return a keyed hash of the user's password hash."""
+        return salted_hmac(
+            "user.AuthTokenSerializer.password",
+            user.password,
+            algorithm="sha256",
+        ).hexdigest()
+
+    def _get_cached_user(self, cache_key, email):
+        """
+        Return the user for recently verified credentials, if still valid.
+
+        The cached entry is only honoured while the user is active and
+        their email and password hash are unchanged, so changing either
+        revokes it.
+        """
+        cached = cache.get(cache_key)
+        if cached is None:
+            return None
+
+        user_id, password_digest = cached
+        user_model = get_user_model()
+        user = user_model.objects.filter(
+            pk=user_id,
+            is_active=True,
+        ).first()
+        if (
+            user
+            and user.email == user_model.objects.normalize_email(email)
+            and constant_time_compare(
+                self._password_digest(user), password_digest)
+        ):
+            return user
+
+        return None
+
     def validate(self, attrs):
         """
         Validate and authenticate the user.
 
+        Credentials verified within the last couple of minutes are
+        served from the cache, skipping the slow password hash check.
+
         Args:
             attrs (dict): The input data to validate.
 
@@ -78,14 +237,22 @@ class AuthTokenSerializer(serializers.Serializer):
         """
         email = attrs.get("email")
         password = attrs.get("password")
-        user = authenticate(
-            request=self.context.get("request"),
-            username=email,
-            password=password
-        )
-        if not user:
-            msg = _("Unable to authenticate with provided credentials.")
-            raise serializers.ValidationError(msg, code="authentication")
+        cache_key = self._credentials_cache_key(email, password)
+        user = self._get_cached_user(cache_key, email)
+        if user is None:
+            user = authenticate(
+                request=self.context.get("request"),
+                username=email,
+                password=password
+            )
+            if not user:
+                msg = _("Unable to authenticate with provided credentials.")
+                raise serializers.ValidationError(msg, code="authentication")
+            cache.set(
+                cache_key,
+                (user.pk, self._password_digest(user)),
+                timeout=CREDENTIALS_CACHE_TIMEOUT,
+            )
 
         attrs["user"] = user
         return attrs
@@ -0,0 +1,27 @@
+"""
+Signal handlers for the user app.
+
+Keep cached token lookups in sync with the token and user tables.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from user.authentication import token_cache_key
+
+
+@receiver([post_save, post_delete], sender=Token)
+def invalidate_token_cache(sender, instance, **kwargs):
+    """Drop the cached lookup of a saved or deleted token."""
+    cache.delete(token_cache_key(instance.key))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_token_cache(sender, instance, **kwargs):
+    """Drop cached lookups of the user's tokens when the user changes."""
+    keys = Token.objects.filter(user=instance).values_list("key", flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
@@ -0,0 +1,30 @@
+"""
+Tests for the API renderers.
+"""
+
+import json
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+
+from user.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """Test rendering responses with orjson."""
+
+    def test_render_data(self):
+        """Test data is rendered as JSON, including non-native types."""
+        data = {"price": Decimal("5.50"), "message": _("Hello"), 1: [None]}
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(
+            json.loads(rendered),
+            {"price": 5.5, "message": "Hello", "1": [None]},
+        )
+
+    def test_render_none(self):
+        """Test rendering no data returns an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b"")
@@ -0,0 +1,45 @@
+"""
+Tests for the user serializers.
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from rest_framework import serializers
+
+from user.serializers import UserSerializer
+
+
+class UserSerializerTests(TestCase):
+    """Test serializing users."""
+
+    def test_representation_matches_model_serializer(self):
+        """Test the hand-written representation matches the generic one."""
+        user = get_user_model().objects.create_user(
+            email="test@example.com",
+            password="test123",
+            name="Test Name",
+        )
+        serializer = UserSerializer(user)
+
+        generic = serializers.ModelSerializer.to_representation(
+            serializer,
+            user,
+        )
+        self.assertEqual(serializer.data, generic)
+
+    def test_fields_built_once(self):
+        """Test model field introspection runs once per class."""
+        UserSerializer().fields
+
+        with patch.object(
+            serializers.ModelSerializer,
+            "get_fields",
+        ) as patched_get_fields:
+            fields = UserSerializer().fields
+
+        patched_get_fields.assert_not_called()
+        self.assertEqual(list(fields), ["email", "password", "name"])
+        self.assertTrue(fields["password"].write_only)
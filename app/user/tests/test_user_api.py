@@ -5,14 +5,20 @@ This module contains tests for the user-related endpoints of the API,
 including user creation, token generation, and profile retrieval/updating.
 """
 
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.test import TestCase
-from django.contrib.auth import get_user_model
+from django.contrib.auth import authenticate, get_user_model
 from django.urls import reverse
 
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from user.serializers import MAX_BULK_USERS
+
 CREATE_USER_URL = reverse("user:create")
+BULK_CREATE_USER_URL = reverse("user:bulk-create")
 TOKEN_URL = reverse("user:token")
 ME_URL = reverse("user:me")
 
@@ -28,6 +34,7 @@ class PublicUserApiTests(TestCase):
     """Test the public features of the user API."""
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
 
     def test_create_user_success(self):
@@ -72,6 +79,14 @@ class PublicUserApiTests(TestCase):
         self.assertFalse(user_exists)
         self.assertIn("password", res.data)
 
+    def test_bulk_create_users_unauthorized(self):
+        """Test authentication is required to create users in bulk."""
+        payload = [{"email": "test@example.com", "password": "testpass123"}]
+        res = self.client.post(BULK_CREATE_USER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(get_user_model().objects.exists())
+
     def test_create_token_for_user(self):
         """Test generates token for valid credentials."""
         user_details = {
@@ -90,6 +105,56 @@ class PublicUserApiTests(TestCase):
         self.assertIn("token", res.data)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
+    def test_create_token_returns_existing_token(self):
+        """Test requesting a token again returns the same token."""
+        create_user(email="test@example.com", password="goodpass")
+        payload = {"email": "test@example.com", "password": "goodpass"}
+
+        first = self.client.post(TOKEN_URL, payload)
+        second = self.client.post(TOKEN_URL, payload)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data["token"], second.data["token"])
+
+    @patch("user.serializers.authenticate", wraps=authenticate)
+    def test_create_token_reuses_verified_credentials(self, patched_auth):
+        """Test repeat token requests skip the password check."""
+        create_user(email="test@example.com", password="goodpass")
+        payload = {"email": "test@example.com", "password": "goodpass"}
+
+        self.client.post(TOKEN_URL, payload)
+        res = self.client.post(TOKEN_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("token", res.data)
+        self.assertEqual(patched_auth.call_count, 1)
+
+    def test_create_token_old_password_after_change(self):
+        """Test a changed password revokes cached credentials."""
+        user = create_user(email="test@example.com", password="goodpass")
+        payload = {"email": "test@example.com", "password": "goodpass"}
+        self.client.post(TOKEN_URL, payload)
+        user.set_password("newpass123")
+        user.save()
+
+        res = self.client.post(TOKEN_URL, payload)
+
+        self.assertNotIn("token", res.data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_token_old_email_after_change(self):
+        """Test a changed email revokes cached credentials."""
+        user = create_user(email="test@example.com", password="goodpass")
+        payload = {"email": "test@example.com", "password": "goodpass"}
+        self.client.post(TOKEN_URL, payload)
+        user.email = "new@example.com"
+        user.save()
+
+        res = self.client.post(TOKEN_URL, payload)
+
+        self.assertNotIn("token", res.data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_create_token_bad_credentials(self):
         """Test token is not created for invalid credentials."""
         create_user(email="test@example.com", password="goodpass")
@@ -110,6 +175,16 @@ class PublicUserApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("password", res.data)
 
+    def test_create_token_throttled(self):
+        """Test repeated login attempts are throttled."""
+        payload = {"email": "test@example.com", "password": "badpass"}
+        for _ in range(10):
+            self.client.post(TOKEN_URL, payload)
+
+        res = self.client.post(TOKEN_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
     def test_retrieve_user_unauthorized(self):
         """Test authentication is required for user profile retrieval."""
         res = self.client.get(ME_URL)
@@ -142,6 +217,40 @@ class PrivateUserApiTests(TestCase):
             },
         )
 
+    def test_retrieve_profile_not_modified(self):
+        """Test revalidating an unchanged profile returns 304."""
+        res = self.client.get(ME_URL)
+        etag = res["ETag"]
+
+        res = self.client.get(ME_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res.content, b"")
+
+    def test_retrieve_profile_modified(self):
+        """Test revalidating a changed profile returns the new data."""
+        res = self.client.get(ME_URL)
+        etag = res["ETag"]
+        self.client.patch(ME_URL, {"name": "Updated Name"})
+        self.user.refresh_from_db()
+
+        res = self.client.get(ME_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["name"], "Updated Name")
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertIn("Authorization", res["Vary"])
+
+    def test_bulk_create_users_not_admin(self):
+        """Test only admins can create users in bulk."""
+        payload = [{"email": "new@example.com", "password": "testpass123"}]
+        res = self.client.post(BULK_CREATE_USER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(
+            get_user_model().objects.filter(email="new@example.com").exists()
+        )
+
     def test_post_me_not_allowed(self):
         """Test that POST is not allowed for the 'me' endpoint."""
         res = self.client.post(ME_URL, {})
@@ -157,3 +266,81 @@ class PrivateUserApiTests(TestCase):
         self.assertEqual(self.user.name, payload["name"])
         self.assertTrue(self.user.check_password(payload["password"]))
         self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class AdminUserApiTests(TestCase):
+    """Test API requests that require an admin user."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_superuser(
+            email="admin@example.com",
+            password="test123",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_bulk_create_users_success(self):
+        """Test creating several users in one request is successful."""
+        payload = [
+            {
+                "email": "test1@example.com",
+                "password": "testpass123",
+                "name": "Test One",
+            },
+            {
+                "email": "test2@example.com",
+                "password": "testpass456",
+                "name": "Test Two",
+            },
+        ]
+        res = self.client.post(BULK_CREATE_USER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.data), 2)
+        for item in payload:
+            user = get_user_model().objects.get(email=item["email"])
+            self.assertEqual(user.name, item["name"])
+            self.assertTrue(user.check_password(item["password"]))
+        for item in res.data:
+            self.assertNotIn("password", item)
+
+    def test_bulk_create_users_duplicate_email_error(self):
+        """Test error returned if the same email appears twice."""
+        user = {
+            "email": "test@example.com",
+            "password": "testpass123",
+            "name": "Test Name",
+        }
+        res = self.client.post(
+            BULK_CREATE_USER_URL,
+            [user, user],
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            get_user_model().objects.filter(email=user["email"]).exists()
+        )
+
+    def test_bulk_create_users_empty_error(self):
+        """Test error returned for an empty list of users."""
+        res = self.client.post(BULK_CREATE_USER_URL, [], format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_users_too_many_error(self):
+        """Test an oversized list is rejected before validating users."""
+        payload = [
+            {"email": f"test{i}@example.com", "password": "testpass123"}
+            for i in range(MAX_BULK_USERS + 1)
+        ]
+
+        with self.assertNumQueries(0):
+            res = self.client.post(
+                BULK_CREATE_USER_URL,
+                payload,
+                format="json",
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,10 +2,25 @@
 Views for the user API.
 """
 
-from rest_framework import generics, authentication, permissions
+import hashlib
+import json
+
+from django.contrib.auth import get_user_model
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import quote_etag
+
+from rest_framework import generics, permissions
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
 from rest_framework.authtoken.views import ObtainAuthToken
-from rest_framework.settings import api_settings
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle
 
+from user.authentication import CachedTokenAuthentication
+from user.renderers import ORJSONRenderer
 from user.serializers import UserSerializer, AuthTokenSerializer
 
 
@@ -13,6 +28,7 @@ class CreateUserView(generics.CreateAPIView):
     """Create a new user in the system."""
 
     serializer_class = UserSerializer
+    throttle_classes = (AnonRateThrottle,)
 
     def post(self, request, *args, **kwargs):
         """
@@ -29,11 +45,31 @@ class CreateUserView(generics.CreateAPIView):
         return self.create(request, *args, **kwargs)
 
 
+class BulkCreateUserView(generics.CreateAPIView):
+    """Create several new users in the system with one request."""
+
+    serializer_class = UserSerializer
+    authentication_classes = (CachedTokenAuthentication,)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Return a serializer for a list of users.
+
+        Returns:
+            BulkUserListSerializer: The serializer for the request data.
+        """
+        kwargs["many"] = True
+        return super().get_serializer(*args, **kwargs)
+
+
 class CreateTokenView(ObtainAuthToken):
     """Create a new auth token for the user."""
 
     serializer_class = AuthTokenSerializer
-    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
+    renderer_classes = (ORJSONRenderer,)
+    throttle_classes = (ScopedRateThrottle,)
+    throttle_scope = "login"
 
     def post(self, request, *args, **kwargs):
         """
@@ -46,21 +82,65 @@ class CreateTokenView(ObtainAuthToken):
         Returns:
             Response: The response object containing the auth token.
         """
-        return super().post(request, *args, **kwargs)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data["user"]
+        # Existing tokens only need their key, so skip building a model
+        key = Token.objects.filter(user=user).values_list(
+            "key", flat=True).first()
+        if key is None:
+            token, created = Token.objects.get_or_create(user=user)
+            key = token.key
+
+        return Response({"token": key})
 
 
 class ManageUserView(generics.RetrieveUpdateAPIView):
     """Manage the authenticated user."""
 
     serializer_class = UserSerializer
-    authentication_classes = (authentication.TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (permissions.IsAuthenticated,)
 
     def get_object(self):
         """
         Retrieve and return the authenticated user.
 
+        Updates reload the user, as the authenticated instance may come
+        from the token cache and saving it would write stale columns back.
+
         Returns:
             User: The authenticated user instance.
         """
+        if self.request.method in ("PUT", "PATCH"):
+            return get_user_model().objects.get(pk=self.request.user.pk)
+
         return self.request.user
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Handle GET requests, letting clients revalidate their copy.
+
+        The ETag is a hash of the user's data. Clients revalidating with
+        it get an empty 304 response when the data has not changed. The
+        response varies by token, as each token identifies another user.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            Response: The response object containing the user data.
+        """
+        data = self.get_serializer(self.get_object()).data
+        etag = quote_etag(hashlib.sha256(
+            json.dumps(data, sort_keys=True).encode()
+        ).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(data)
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+
+        return response